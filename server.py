@@ -7,17 +7,22 @@ Uses Naver News Search API.
 """
 
 import asyncio
-import json
+import functools
 import logging
 import os
 import re
+import time
+from collections import defaultdict
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, Iterator, List, Literal, Optional
 from urllib.parse import quote
 
 from credential import openai_api_key, naver_client_id, naver_client_secret
 
 import aiohttp
+import orjson
+from cachetools import TTLCache
 from openai import AsyncOpenAI
 from pydantic import BaseModel
 from mcp.server import Server
@@ -39,6 +44,112 @@ logger = logging.getLogger("news-mcp-server")
 # Naver News Search API 설정
 NAVER_API_BASE_URL = "https://openapi.naver.com/v1/search/news.json"
 
+# 네이버 응답의 HTML 태그/엔티티 정리용 패턴
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_ENTITY_MAP = {
+    "&quot;": '"',
+    "&amp;": '&',
+    "&lt;": '<',
+    "&gt;": '>',
+    "&apos;": "'"
+}
+_ENTITY_RE = re.compile("|".join(map(re.escape, _ENTITY_MAP)))
+
+# 네이버 검색 API가 지원하는 정렬 방법
+_SORTS = frozenset({"sim", "date"})
+
+# 제목 중복 판별 시 무시할 문자 (공백, 문장부호 등)
+_NON_WORD_RE = re.compile(r'\W+')
+
+
+def _title_fingerprint(title: str) -> int:
+    """
+    대소문자와 공백/문장부호를 무시한 제목 지문을 반환합니다.
+    
+    정규화 결과가 비면(문장부호/이모지만 있는 제목) 원래 제목으로 지문을 만듭니다.
+    """
+    return hash(_NON_WORD_RE.sub('', title.lower()) or title)
+
+
+def _clamp(value: int, lo: int, hi: int) -> int:
+    """value를 [lo, hi] 범위로 제한합니다."""
+    return lo if value < lo else hi if value > hi else value
+
+
+def _trim(text: str, limit: int = 400) -> str:
+    """문자열을 최대 limit 글자로 자르고, 잘린 경우 말줄임표를 붙입니다."""
+    return text if len(text) <= limit else text[:limit] + "…"
+
+
+# 뉴스 리서치 레포트의 고정 섹션 (기사 목록 머리말, 푸터)
+_REPORT_ARTICLES_HEADER = "## 📰 주요 뉴스 요약\n\n"
+_REPORT_FOOTER = "\n---\n*본 레포트는 네이버 뉴스 검색 API를 통해 자동 생성되었습니다.*"
+
+# 뉴스 리서치 레포트의 기사 블록 템플릿 (블록 구분선과 다음 블록 앞 빈 줄 포함)
+_BLOCK_SEP = "\n---\n\n"
+_ARTICLE_TMPL = (
+    "### {i}. {title}\n"
+    "📅 **발행일:** {pubDate}\n"
+    "\n"
+    "**내용 요약:**\n"
+    "> {description}\n"
+    "\n"
+    "{links}"
+) + _BLOCK_SEP
+
+# 레포트 기사 블록의 링크 줄 포맷터
+_FMT_ORIG = "🔗 [원문 보기]({})\n".format
+_FMT_NAVER = "🔗 [네이버 뉴스]({})\n".format
+
+# 레포트 기사 dict에서 렌더링에 필요한 필드
+_REPORT_ARTICLE_GET = itemgetter(
+    "originallink", "link", "has_distinct_link", "title", "pubDate", "description"
+)
+
+
+def _render_links(original_link: str, naver_link: str, has_distinct_link: bool) -> str:
+    """레포트 기사 블록의 링크 줄을 생성합니다."""
+    if original_link:
+        if has_distinct_link:
+            return _FMT_ORIG(original_link) + _FMT_NAVER(naver_link)
+        return _FMT_ORIG(original_link)
+    return _FMT_NAVER(naver_link) if has_distinct_link else ""
+
+
+def _render_article_with_links(i: int, article: Dict[str, Any]) -> str:
+    """링크를 포함한 레포트 기사 블록을 렌더링합니다."""
+    original_link, naver_link, has_distinct_link, title, pub_date, description = (
+        _REPORT_ARTICLE_GET(article)
+    )
+    return _ARTICLE_TMPL.format_map({
+        "i": i,
+        "title": title,
+        "pubDate": pub_date,
+        "description": description,
+        "links": _render_links(original_link, naver_link, has_distinct_link)
+    })
+
+
+def _render_article_no_links(i: int, article: Dict[str, Any]) -> str:
+    """링크 없이 레포트 기사 블록을 렌더링합니다."""
+    *_, title, pub_date, description = _REPORT_ARTICLE_GET(article)
+    return _ARTICLE_TMPL.format_map({
+        "i": i,
+        "title": title,
+        "pubDate": pub_date,
+        "description": description,
+        "links": ""
+    })
+
+
+class NaverAPIError(Exception):
+    """네이버 검색 API가 200 이외의 상태 코드를 반환했을 때 발생합니다."""
+
+    def __init__(self, status: int, text: str):
+        super().__init__(f"{status} - {text}")
+        self.status = status
+        self.text = text
+
 
 class ArticleSummary(BaseModel):
     id: str
@@ -61,6 +172,19 @@ class NewsSummaryReport(BaseModel):
     keywords: list[KeywordCuration]
 
 
+# MCP 서버 초기화 옵션 (정적이므로 import 시 한 번만 생성)
+_INIT_OPTIONS = InitializationOptions(
+    server_name="news-mcp-server",
+    server_version="1.0.0",
+    capabilities={
+        "resources": {},
+        "tools": {},
+        "prompts": {},
+        "logging": {}
+    }
+)
+
+
 class NewsMCPServer:
     # 뉴스 카테고리 정의
     NEWS_CATEGORIES = {
@@ -109,6 +233,10 @@ class NewsMCPServer:
     def __init__(self):
         self.app = Server("news-mcp-server")
         self.session: Optional[aiohttp.ClientSession] = None
+        # (query, display, start, sort) -> 네이버 검색 응답 (5분 TTL)
+        self._naver_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+        # 네이버 API 동시 요청 수 제한 (이벤트 루프 안에서 생성)
+        self._naver_sem: Optional[asyncio.Semaphore] = None
         
         # 환경 변수에서 API 키 로드
         self.client_id = naver_client_id
@@ -119,6 +247,16 @@ class NewsMCPServer:
         else:
             logger.info("Naver API credentials loaded successfully")
         
+        # 네이버 API 요청 헤더 (세션 기본 헤더로 재사용)
+        self._naver_headers: Optional[Dict[str, str]] = (
+            {
+                "X-Naver-Client-Id": self.client_id,
+                "X-Naver-Client-Secret": self.client_secret
+            }
+            if self.client_id and self.client_secret
+            else None
+        )
+        
         # OpenAI API 키 로드
         self.openai_api_key = openai_api_key
         self.openai_client: Optional[AsyncOpenAI] = None
@@ -129,14 +267,15 @@ class NewsMCPServer:
             self.openai_client = AsyncOpenAI(api_key=self.openai_api_key)
             logger.info("OpenAI API client initialized successfully")
         
-        # 뉴스 요약 프롬프트 로드
-        self.summary_prompt = self._load_summary_prompt()
+        # 카테고리 정보는 정적이므로 클래스 단위로 한 번만 생성
+        self._build_caches()
         
         # Register handlers
         self._setup_handlers()
     
-    def _load_summary_prompt(self) -> str:
-        """news_summary_prompt.md 파일에서 시스템 프롬프트를 로드합니다."""
+    @functools.cached_property
+    def summary_prompt(self) -> str:
+        """news_summary_prompt.md 파일에서 시스템 프롬프트를 처음 사용할 때 로드합니다."""
         prompt_file = Path(__file__).parent / "news_summary_prompt.md"
         try:
             if prompt_file.exists():
@@ -160,165 +299,170 @@ Output in Korean with JSON format."""
     def _setup_handlers(self):
         """Setup MCP server handlers"""
         
+        # 리소스 목록은 정적이므로 한 번만 생성
+        resources = [
+            Resource(
+                uri="news://search",
+                name="News Search",
+                description="Search for news articles",
+                mimeType="application/json"
+            ),
+            Resource(
+                uri="news://categories",
+                name="News Categories",
+                description="사용 가능한 뉴스 카테고리 목록 (Available news categories)",
+                mimeType="application/json"
+            )
+        ]
+        
         @self.app.list_resources()
         async def handle_list_resources() -> List[Resource]:
             """List available resources"""
-            return [
-                Resource(
-                    uri="news://search",
-                    name="News Search",
-                    description="Search for news articles",
-                    mimeType="application/json"
-                ),
-                Resource(
-                    uri="news://categories",
-                    name="News Categories",
-                    description="사용 가능한 뉴스 카테고리 목록 (Available news categories)",
-                    mimeType="application/json"
-                )
-            ]
+            return resources
         
         @self.app.read_resource()
         async def handle_read_resource(uri: str) -> str:
             """Read a specific resource"""
             if uri == "news://search":
-                return json.dumps({
+                return orjson.dumps({
                     "description": "Use the search_news tool to find news articles",
                     "example": "search_news with query='technology'"
-                }, ensure_ascii=False)
+                }).decode("utf-8")
             elif uri == "news://categories":
-                return json.dumps(self._get_categories(), ensure_ascii=False)
+                return orjson.dumps(self._get_categories()).decode("utf-8")
             else:
                 raise ValueError(f"Unknown resource: {uri}")
         
-        @self.app.list_tools()
-        async def handle_list_tools() -> List[Tool]:
-            """List available tools"""
-            # 카테고리 ID 목록 생성
-            category_ids = list(self.NEWS_CATEGORIES.keys())
-            category_desc = ", ".join([f"{k}({v['name']})" for k, v in self.NEWS_CATEGORIES.items()])
-            
-            return [
-                Tool(
-                    name="search_news",
-                    description="네이버 뉴스에서 키워드로 뉴스 기사를 검색합니다 (Search for news articles by keyword using Naver News API)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "검색어 (Search query keywords)"
-                            },
-                            "display": {
-                                "type": "integer",
-                                "description": "한 번에 표시할 검색 결과 개수 (기본값: 10, 최댓값: 100)",
-                                "default": 10
-                            },
-                            "start": {
-                                "type": "integer",
-                                "description": "검색 시작 위치 (기본값: 1, 최댓값: 1000)",
-                                "default": 1
-                            },
-                            "sort": {
-                                "type": "string",
-                                "enum": ["sim", "date"],
-                                "description": "검색 결과 정렬 방법 - sim: 정확도순(기본값), date: 날짜순",
-                                "default": "sim"
-                            }
+        # 도구 목록은 NEWS_CATEGORIES에서만 파생되므로 한 번만 생성
+        category_ids = list(self.NEWS_CATEGORIES.keys())
+        category_desc = ", ".join(f"{k}({v['name']})" for k, v in self.NEWS_CATEGORIES.items())
+        
+        tools = [
+            Tool(
+                name="search_news",
+                description="네이버 뉴스에서 키워드로 뉴스 기사를 검색합니다 (Search for news articles by keyword using Naver News API)",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "검색어 (Search query keywords)"
                         },
-                        "required": ["query"]
-                    }
-                ),
-                Tool(
-                    name="get_category_news",
-                    description=f"특정 카테고리의 최신 뉴스를 가져옵니다. 사용 가능한 카테고리: {category_desc}",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "category": {
-                                "type": "string",
-                                "enum": category_ids,
-                                "description": f"뉴스 카테고리 ID: {category_desc}"
-                            },
-                            "display": {
-                                "type": "integer",
-                                "description": "한 번에 표시할 검색 결과 개수 (기본값: 10, 최댓값: 100)",
-                                "default": 10
-                            },
-                            "sort": {
-                                "type": "string",
-                                "enum": ["sim", "date"],
-                                "description": "검색 결과 정렬 방법 - sim: 정확도순, date: 날짜순(기본값)",
-                                "default": "date"
-                            }
+                        "display": {
+                            "type": "integer",
+                            "description": "한 번에 표시할 검색 결과 개수 (기본값: 10, 최댓값: 100)",
+                            "default": 10
                         },
-                        "required": ["category"]
-                    }
-                ),
-                Tool(
-                    name="list_categories",
-                    description="사용 가능한 모든 뉴스 카테고리 목록과 설명을 반환합니다 (List all available news categories)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="generate_news_report",
-                    description="특정 주제에 대해 뉴스를 검색하고 종합적인 리서치 레포트를 생성합니다. 주제를 입력하면 관련 뉴스를 수집하여 트렌드, 주요 이슈, 핵심 내용을 정리한 레포트를 만들어줍니다.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "topic": {
-                                "type": "string",
-                                "description": "레포트를 생성할 주제 (예: '인공지능 산업 동향', '부동산 시장', '전기차 시장')"
-                            },
-                            "keywords": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "추가 검색 키워드 (선택사항, 기본: 주제를 기반으로 자동 생성)"
-                            },
-                            "num_articles": {
-                                "type": "integer",
-                                "description": "수집할 뉴스 기사 수 (기본값: 15, 최대: 50)",
-                                "default": 15
-                            },
-                            "include_links": {
-                                "type": "boolean",
-                                "description": "레포트에 원문 링크 포함 여부 (기본값: true)",
-                                "default": True
-                            }
+                        "start": {
+                            "type": "integer",
+                            "description": "검색 시작 위치 (기본값: 1, 최댓값: 1000)",
+                            "default": 1
                         },
-                        "required": ["topic"]
-                    }
-                ),
-                Tool(
-                    name="search_and_summarize_news",
-                    description="키워드로 뉴스를 검색하고 OpenAI를 활용하여 전문적인 요약을 제공합니다. 뉴스 유형(사실/분석/예측/혼합)을 분류하고, 핵심 팩트와 수치를 중심으로 간결하게 요약합니다.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "keywords": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "검색할 키워드 목록 (예: ['AI 반도체', '삼성전자'])"
-                            },
-                            "num_articles": {
-                                "type": "integer",
-                                "description": "키워드당 검색할 뉴스 기사 수 (기본값: 5, 최대: 10)",
-                                "default": 5
-                            },
-                            "include_keyword_curation": {
-                                "type": "boolean",
-                                "description": "각 키워드별 신뢰할 수 있는 3개 뉴스 소스 큐레이션 포함 여부 (기본값: true)",
-                                "default": True
-                            }
+                        "sort": {
+                            "type": "string",
+                            "enum": ["sim", "date"],
+                            "description": "검색 결과 정렬 방법 - sim: 정확도순(기본값), date: 날짜순",
+                            "default": "sim"
+                        }
+                    },
+                    "required": ["query"]
+                }
+            ),
+            Tool(
+                name="get_category_news",
+                description=f"특정 카테고리의 최신 뉴스를 가져옵니다. 사용 가능한 카테고리: {category_desc}",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "category": {
+                            "type": "string",
+                            "enum": category_ids,
+                            "description": f"뉴스 카테고리 ID: {category_desc}"
                         },
-                        "required": ["keywords"]
-                    }
-                )
-            ]
+                        "display": {
+                            "type": "integer",
+                            "description": "한 번에 표시할 검색 결과 개수 (기본값: 10, 최댓값: 100)",
+                            "default": 10
+                        },
+                        "sort": {
+                            "type": "string",
+                            "enum": ["sim", "date"],
+                            "description": "검색 결과 정렬 방법 - sim: 정확도순, date: 날짜순(기본값)",
+                            "default": "date"
+                        }
+                    },
+                    "required": ["category"]
+                }
+            ),
+            Tool(
+                name="list_categories",
+                description="사용 가능한 모든 뉴스 카테고리 목록과 설명을 반환합니다 (List all available news categories)",
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            ),
+            Tool(
+                name="generate_news_report",
+                description="특정 주제에 대해 뉴스를 검색하고 종합적인 리서치 레포트를 생성합니다. 주제를 입력하면 관련 뉴스를 수집하여 트렌드, 주요 이슈, 핵심 내용을 정리한 레포트를 만들어줍니다.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "topic": {
+                            "type": "string",
+                            "description": "레포트를 생성할 주제 (예: '인공지능 산업 동향', '부동산 시장', '전기차 시장')"
+                        },
+                        "keywords": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "추가 검색 키워드 (선택사항, 기본: 주제를 기반으로 자동 생성)"
+                        },
+                        "num_articles": {
+                            "type": "integer",
+                            "description": "수집할 뉴스 기사 수 (기본값: 15, 최대: 50)",
+                            "default": 15
+                        },
+                        "include_links": {
+                            "type": "boolean",
+                            "description": "레포트에 원문 링크 포함 여부 (기본값: true)",
+                            "default": True
+                        }
+                    },
+                    "required": ["topic"]
+                }
+            ),
+            Tool(
+                name="search_and_summarize_news",
+                description="키워드로 뉴스를 검색하고 OpenAI를 활용하여 전문적인 요약을 제공합니다. 뉴스 유형(사실/분석/예측/혼합)을 분류하고, 핵심 팩트와 수치를 중심으로 간결하게 요약합니다.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "keywords": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "검색할 키워드 목록 (예: ['AI 반도체', '삼성전자'])"
+                        },
+                        "num_articles": {
+                            "type": "integer",
+                            "description": "키워드당 검색할 뉴스 기사 수 (기본값: 5, 최대: 10)",
+                            "default": 5
+                        },
+                        "include_keyword_curation": {
+                            "type": "boolean",
+                            "description": "각 키워드별 신뢰할 수 있는 3개 뉴스 소스 큐레이션 포함 여부 (기본값: true)",
+                            "default": True
+                        }
+                    },
+                    "required": ["keywords"]
+                }
+            )
+        ]
+        
+        @self.app.list_tools()
+        async def handle_list_tools() -> List[Tool]:
+            """List available tools"""
+            return tools
         
         @self.app.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
@@ -343,7 +487,23 @@ Output in Korean with JSON format."""
     async def _ensure_session(self):
         """Ensure we have an active aiohttp session"""
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=20,
+                    limit_per_host=10,
+                    keepalive_timeout=60,
+                    ttl_dns_cache=300
+                ),
+                headers=self._naver_headers,
+                json_serialize=lambda o: orjson.dumps(o).decode()
+            )
+        if self._naver_sem is None:
+            self._naver_sem = asyncio.Semaphore(10)
+    
+    async def aclose(self):
+        """Close the aiohttp session"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
     
     async def _search_news(
         self, 
@@ -372,42 +532,19 @@ Output in Korean with JSON format."""
             )]
         
         # 파라미터 유효성 검사
-        display = max(1, min(display, 100))  # 1~100
-        start = max(1, min(start, 1000))  # 1~1000
-        if sort not in ["sim", "date"]:
-            sort = "sim"
-        
-        # 요청 헤더 설정
-        headers = {
-            "X-Naver-Client-Id": self.client_id,
-            "X-Naver-Client-Secret": self.client_secret
-        }
-        
-        # 요청 파라미터 설정
-        params = {
-            "query": query,
-            "display": display,
-            "start": start,
-            "sort": sort
-        }
+        display = _clamp(display, 1, 100)
+        start = _clamp(start, 1, 1000)
+        sort = sort if sort in _SORTS else "sim"
         
         try:
-            async with self.session.get(
-                NAVER_API_BASE_URL,
-                headers=headers,
-                params=params
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    logger.error(f"Naver API error: {response.status} - {error_text}")
-                    return [TextContent(
-                        type="text",
-                        text=f"API 오류 (상태 코드: {response.status}): {error_text}"
-                    )]
-                
-                data = await response.json()
-                return self._format_news_results(data, query)
-                
+            data = await self._naver_get(query, display, start, sort)
+            return self._format_news_results(data, query)
+        except NaverAPIError as e:
+            logger.error(f"Naver API error: {e}")
+            return [TextContent(
+                type="text",
+                text=f"API 오류 (상태 코드: {e.status}): {e.text}"
+            )]
         except aiohttp.ClientError as e:
             logger.error(f"Network error: {str(e)}")
             return [TextContent(
@@ -415,9 +552,13 @@ Output in Korean with JSON format."""
                 text=f"네트워크 오류: {str(e)}"
             )]
     
-    def _get_categories(self) -> Dict[str, Any]:
-        """카테고리 정보를 반환합니다."""
-        return {
+    @classmethod
+    def _build_caches(cls):
+        """NEWS_CATEGORIES에서 파생되는 조회 테이블과 응답을 미리 생성합니다."""
+        if hasattr(cls, "_CAT_FIRST_KEYWORD"):
+            return
+        
+        cls._CATEGORIES_PAYLOAD = {
             "categories": [
                 {
                     "id": cat_id,
@@ -425,30 +566,37 @@ Output in Korean with JSON format."""
                     "description": cat_info["description"],
                     "sample_keywords": cat_info["keywords"]
                 }
-                for cat_id, cat_info in self.NEWS_CATEGORIES.items()
+                for cat_id, cat_info in cls.NEWS_CATEGORIES.items()
             ]
         }
-    
-    def _list_categories(self) -> List[TextContent]:
-        """카테고리 목록을 텍스트 형식으로 반환합니다."""
-        lines = [
+        cls._CATEGORIES_TEXT = "\n".join([
             "## 📂 뉴스 카테고리 목록",
             "",
             "다음 카테고리로 뉴스를 검색할 수 있습니다:",
-            ""
-        ]
-        
-        for cat_id, cat_info in self.NEWS_CATEGORIES.items():
-            lines.append(f"### {cat_info['name']} (`{cat_id}`)")
-            lines.append(f"- **설명:** {cat_info['description']}")
-            lines.append(f"- **관련 키워드:** {', '.join(cat_info['keywords'])}")
-            lines.append("")
-        
-        lines.append("---")
-        lines.append("💡 **사용법:** `get_category_news` 도구에서 category 파라미터에 카테고리 ID를 사용하세요.")
-        lines.append("예: `get_category_news(category='tech')` → IT/과학 뉴스 검색")
-        
-        return [TextContent(type="text", text="\n".join(lines))]
+            "",
+            *(
+                f"### {cat_info['name']} (`{cat_id}`)\n"
+                f"- **설명:** {cat_info['description']}\n"
+                f"- **관련 키워드:** {', '.join(cat_info['keywords'])}\n"
+                for cat_id, cat_info in cls.NEWS_CATEGORIES.items()
+            ),
+            "---",
+            "💡 **사용법:** `get_category_news` 도구에서 category 파라미터에 카테고리 ID를 사용하세요.",
+            "예: `get_category_news(category='tech')` → IT/과학 뉴스 검색"
+        ])
+        # 카테고리 검색에는 첫 번째 키워드를 사용
+        cls._CAT_FIRST_KEYWORD = {
+            cat_id: cat_info["keywords"][0]
+            for cat_id, cat_info in cls.NEWS_CATEGORIES.items()
+        }
+    
+    def _get_categories(self) -> Dict[str, Any]:
+        """카테고리 정보를 반환합니다."""
+        return self._CATEGORIES_PAYLOAD
+    
+    def _list_categories(self) -> List[TextContent]:
+        """카테고리 목록을 텍스트 형식으로 반환합니다."""
+        return [TextContent(type="text", text=self._CATEGORIES_TEXT)]
     
     async def _get_category_news(
         self,
@@ -464,17 +612,15 @@ Output in Korean with JSON format."""
             display: 표시할 결과 개수
             sort: 정렬 방법
         """
-        if category not in self.NEWS_CATEGORIES:
+        # 카테고리의 첫 번째 키워드로 검색
+        query = self._CAT_FIRST_KEYWORD.get(category)
+        if query is None:
             available = ", ".join(self.NEWS_CATEGORIES.keys())
             return [TextContent(
                 type="text",
                 text=f"오류: 알 수 없는 카테고리 '{category}'. 사용 가능한 카테고리: {available}"
             )]
         
-        cat_info = self.NEWS_CATEGORIES[category]
-        # 카테고리의 첫 번째 키워드로 검색
-        query = cat_info["keywords"][0]
-        
         return await self._search_news(
             query=query,
             display=display,
@@ -483,15 +629,15 @@ Output in Korean with JSON format."""
     
     def _clean_html_tags(self, text: str) -> str:
         """HTML 태그를 제거합니다."""
+        # 태그도 엔티티도 없는 문자열은 그대로 반환
+        if '<' not in text and '&' not in text:
+            return text
         # <b> 태그 등 HTML 태그 제거
-        clean_text = re.sub(r'<[^>]+>', '', text)
-        # HTML 엔티티 변환
-        clean_text = clean_text.replace("&quot;", '"')
-        clean_text = clean_text.replace("&amp;", '&')
-        clean_text = clean_text.replace("&lt;", '<')
-        clean_text = clean_text.replace("&gt;", '>')
-        clean_text = clean_text.replace("&apos;", "'")
-        return clean_text
+        clean_text = _HTML_TAG_RE.sub('', text)
+        if '&' not in clean_text:
+            return clean_text
+        # HTML 엔티티를 한 번에 변환
+        return _ENTITY_RE.sub(lambda m: _ENTITY_MAP[m.group(0)], clean_text)
     
     def _format_news_results(self, data: Dict[str, Any], query: str) -> List[TextContent]:
         """API 응답을 읽기 좋은 형식으로 포맷팅합니다."""
@@ -506,29 +652,122 @@ Output in Korean with JSON format."""
                 text=f"'{query}'에 대한 검색 결과가 없습니다."
             )]
         
-        result_lines = [
-            f"## 📰 '{query}' 뉴스 검색 결과",
-            f"총 {total:,}개의 결과 중 {start}~{start + len(items) - 1}번째 결과",
-            ""
-        ]
+        header = (
+            f"## 📰 '{query}' 뉴스 검색 결과\n"
+            f"총 {total:,}개의 결과 중 {start}~{start + len(items) - 1}번째 결과\n"
+            "\n"
+        )
         
+        clean = self._clean_html_tags
+        blocks = []
+        append = blocks.append
         for i, item in enumerate(items, start):
-            title = self._clean_html_tags(item.get("title", "제목 없음"))
-            description = self._clean_html_tags(item.get("description", "내용 없음"))
+            get = item.get
+            title = get("title", "제목 없음")
+            description = get("description", "내용 없음")
+            original_link = get("originallink", "")
+            naver_link = get("link", "")
+            pub_date = get("pubDate", "알 수 없음")
+            original_line = f"\n**원문 링크:** {original_link}" if original_link else ""
+            naver_line = (
+                f"\n**네이버 뉴스:** {naver_link}"
+                if naver_link and naver_link != original_link else ""
+            )
+            append(
+                f"### {i}. {clean(title)}\n"
+                f"**발행일:** {pub_date}\n"
+                f"**요약:** {clean(description)}{original_line}{naver_line}\n"
+            )
+        
+        return [TextContent(type="text", text=header + "\n".join(blocks))]
+    
+    async def _naver_get(
+        self,
+        query: str,
+        display: int,
+        start: int,
+        sort: str
+    ) -> Dict[str, Any]:
+        """
+        네이버 뉴스 검색 API를 호출하고 JSON 응답을 반환합니다.
+        
+        같은 파라미터의 성공 응답은 TTL 캐시에서 재사용하며, 오류 응답은 캐시하지 않습니다.
+        
+        Raises:
+            NaverAPIError: API가 200 이외의 상태 코드를 반환한 경우
+            aiohttp.ClientError: 네트워크 오류
+        """
+        key = (query, display, start, sort)
+        cached = self._naver_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        params = {
+            "query": query,
+            "display": display,
+            "start": start,
+            "sort": sort
+        }
+        
+        async with self._naver_sem:
+            async with self.session.get(
+                NAVER_API_BASE_URL,
+                params=params
+            ) as response:
+                if response.status != 200:
+                    raise NaverAPIError(response.status, await response.text())
+                
+                data = await response.json(loads=orjson.loads)
+        
+        self._naver_cache[key] = data
+        return data
+    
+    async def _fetch_keyword(
+        self,
+        keyword: str,
+        display: int,
+        sort: str
+    ) -> List[Dict[str, Any]]:
+        """
+        키워드 하나로 네이버 뉴스를 검색하고 HTML이 정리된 기사 목록을 반환합니다.
+        
+        API/네트워크/타임아웃/응답 파싱 오류는 로그로 남기고 빈 목록을 반환하므로,
+        한 키워드의 실패가 같은 TaskGroup의 다른 검색을 취소하지 않습니다.
+        
+        Args:
+            keyword: 검색어
+            display: 가져올 결과 개수
+            sort: 정렬 방법
+        """
+        try:
+            data = await self._naver_get(keyword, display, 1, sort)
+        except NaverAPIError as e:
+            logger.error(f"Naver API error for '{keyword}': {e}")
+            return []
+        except aiohttp.ClientError as e:
+            logger.error(f"Network error for '{keyword}': {str(e)}")
+            return []
+        except asyncio.TimeoutError:
+            logger.error(f"Timeout for '{keyword}'")
+            return []
+        except ValueError as e:
+            logger.error(f"Invalid response for '{keyword}': {str(e)}")
+            return []
+        
+        articles = []
+        for item in data.get("items", []):
             original_link = item.get("originallink", "")
             naver_link = item.get("link", "")
-            pub_date = item.get("pubDate", "알 수 없음")
-            
-            result_lines.append(f"### {i}. {title}")
-            result_lines.append(f"**발행일:** {pub_date}")
-            result_lines.append(f"**요약:** {description}")
-            if original_link:
-                result_lines.append(f"**원문 링크:** {original_link}")
-            if naver_link and naver_link != original_link:
-                result_lines.append(f"**네이버 뉴스:** {naver_link}")
-            result_lines.append("")
-        
-        return [TextContent(type="text", text="\n".join(result_lines))]
+            articles.append({
+                "title": self._clean_html_tags(item.get("title", "")),
+                "description": self._clean_html_tags(item.get("description", "")),
+                "originallink": original_link,
+                "link": naver_link,
+                "pubDate": item.get("pubDate", ""),
+                # 네이버 링크가 원문 링크와 다른지 (레포트에서 별도 표시 여부)
+                "has_distinct_link": bool(naver_link) and naver_link != original_link
+            })
+        return articles
     
     async def _generate_news_report(
         self,
@@ -557,7 +796,7 @@ Output in Korean with JSON format."""
             )]
         
         # 파라미터 유효성 검사
-        num_articles = max(5, min(num_articles, 50))
+        num_articles = _clamp(num_articles, 5, 50)
         
         # 검색 키워드 준비 (주제 + 추가 키워드)
         search_queries = [topic]
@@ -566,50 +805,37 @@ Output in Korean with JSON format."""
         
         # 모든 수집된 기사를 저장
         all_articles = []
-        seen_titles = set()  # 중복 제거용
-        
-        # 각 키워드로 검색 수행
-        headers = {
-            "X-Naver-Client-Id": self.client_id,
-            "X-Naver-Client-Secret": self.client_secret
-        }
+        seen: set[int] = set()  # 중복 제거용 제목 지문
         
-        articles_per_query = max(5, num_articles // len(search_queries))
+        # 쿼리당 기사 수: 목표치를 쿼리 수로 나눈 값(올림)에 중복 제거 여유분을 더함
+        articles_per_query = -(-num_articles // len(search_queries))
+        articles_per_query += max(2, articles_per_query // 4)
         
-        for query in search_queries:
-            params = {
-                "query": query,
-                "display": min(articles_per_query, 100),
-                "start": 1,
-                "sort": "date"  # 최신순으로 검색
-            }
+        # 각 키워드로 검색 수행 (동시 요청, 결과는 쿼리 순서대로 반영)
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(
+                    self._fetch_keyword(query, min(articles_per_query, 100), "date")
+                )
+                for query in search_queries
+            ]
+            for query, task in zip(search_queries, tasks):
+                for article in await task:
+                    title = article["title"]
+                    if not title:
+                        continue
+                    # 중복 제거
+                    fp = _title_fingerprint(title)
+                    if fp not in seen:
+                        seen.add(fp)
+                        article["search_query"] = query
+                        all_articles.append(article)
+                # 목표치를 채우면 남은 요청 취소
+                if len(all_articles) >= num_articles:
+                    break
             
-            try:
-                async with self.session.get(
-                    NAVER_API_BASE_URL,
-                    headers=headers,
-                    params=params
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        items = data.get("items", [])
-                        
-                        for item in items:
-                            title = self._clean_html_tags(item.get("title", ""))
-                            # 중복 제거
-                            if title and title not in seen_titles:
-                                seen_titles.add(title)
-                                all_articles.append({
-                                    "title": title,
-                                    "description": self._clean_html_tags(item.get("description", "")),
-                                    "originallink": item.get("originallink", ""),
-                                    "link": item.get("link", ""),
-                                    "pubDate": item.get("pubDate", ""),
-                                    "search_query": query
-                                })
-            except aiohttp.ClientError as e:
-                logger.error(f"Network error for query '{query}': {str(e)}")
-                continue
+            for task in tasks:
+                task.cancel()
         
         if not all_articles:
             return [TextContent(
@@ -657,46 +883,27 @@ Output in Korean with JSON format."""
             )]
         
         # 파라미터 유효성 검사
-        num_articles = max(1, min(num_articles, 10))
+        num_articles = _clamp(num_articles, 1, 10)
         keywords = keywords[:5]  # 최대 5개 키워드
         
-        # 각 키워드별로 뉴스 검색
+        # 각 키워드별로 뉴스 검색 (동시 요청)
         all_news_data = []
-        headers = {
-            "X-Naver-Client-Id": self.client_id,
-            "X-Naver-Client-Secret": self.client_secret
-        }
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self._fetch_keyword(k, num_articles, "date"))
+                for k in keywords
+            ]
         
-        for keyword in keywords:
-            params = {
-                "query": keyword,
-                "display": num_articles,
-                "start": 1,
-                "sort": "date"
-            }
-            
-            try:
-                async with self.session.get(
-                    NAVER_API_BASE_URL,
-                    headers=headers,
-                    params=params
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        items = data.get("items", [])
-                        
-                        for idx, item in enumerate(items, 1):
-                            all_news_data.append({
-                                "id": f"{keyword}_{idx}",
-                                "keyword": keyword,
-                                "제목": self._clean_html_tags(item.get("title", "")),
-                                "본문": self._clean_html_tags(item.get("description", "")),
-                                "link": item.get("originallink", "") or item.get("link", ""),
-                                "pubDate": item.get("pubDate", "")
-                            })
-            except aiohttp.ClientError as e:
-                logger.error(f"Network error for keyword '{keyword}': {str(e)}")
-                continue
+        for keyword, task in zip(keywords, tasks):
+            for idx, article in enumerate(task.result(), 1):
+                all_news_data.append({
+                    "id": f"{keyword}_{idx}",
+                    "keyword": keyword,
+                    "제목": article["title"],
+                    "본문": article["description"],
+                    "link": article["originallink"] or article["link"],
+                    "pubDate": article["pubDate"]
+                })
         
         if not all_news_data:
             return [TextContent(
@@ -725,36 +932,40 @@ Output in Korean with JSON format."""
     ) -> str:
         """OpenAI Responses API를 사용하여 뉴스를 요약합니다."""
 
-        # 뉴스 데이터를 OpenAI에 전달할 형식으로 변환
+        # 뉴스 데이터를 OpenAI에 전달할 형식으로 변환 (입력 토큰 상한을 위해 길이 제한)
         news_list = [
-            {"id": item["id"], "제목": item["제목"], "본문": item["본문"]}
+            {"id": item["id"], "제목": _trim(item["제목"], 200), "본문": _trim(item["본문"], 400)}
             for item in news_data
         ]
 
-        # 사용자 메시지 구성
-        user_message_parts = [
-            "다음 뉴스 기사들을 분석하고 요약해주세요.\n",
-            f"news_list: {json.dumps(news_list, ensure_ascii=False)}\n",
-        ]
+        # 사용자 메시지 구성 (안내문 + 구조화된 JSON 페이로드)
+        payload: Dict[str, Any] = {"news_list": news_list}
         if keywords_for_curation:
-            user_message_parts.append(
-                f"\nkeywords: {json.dumps(keywords_for_curation, ensure_ascii=False)}"
-            )
-        user_message = "\n".join(user_message_parts)
+            payload["keywords"] = keywords_for_curation
+        content_parts = [
+            {"type": "input_text", "text": "다음 뉴스 기사들을 분석하고 요약해주세요."},
+            {"type": "input_text", "text": orjson.dumps(payload).decode()},
+        ]
 
         # OpenAI Responses API 호출 (Structured Outputs)
         response = await self.openai_client.responses.parse(
             model="gpt-5.4-mini",
             instructions=self.summary_prompt,
-            input=user_message,
+            input=[{"role": "user", "content": content_parts}],
             text_format=NewsSummaryReport,
             max_output_tokens=20000,
         )
 
-        parsed: NewsSummaryReport = response.output_parsed
-        result_text = json.dumps(
-            parsed.model_dump(), ensure_ascii=False, indent=2
-        )
+        # 토큰 한도 초과 등으로 응답이 중단되면 파싱 결과가 없음
+        parsed: Optional[NewsSummaryReport] = response.output_parsed
+        if response.status == "incomplete" or parsed is None:
+            details = getattr(response, "incomplete_details", None)
+            reason = getattr(details, "reason", None) or "구조화된 응답 없음"
+            raise RuntimeError(f"OpenAI 응답이 완료되지 않았습니다 ({reason})")
+
+        result_text = orjson.dumps(
+            parsed.model_dump(), option=orjson.OPT_INDENT_2
+        ).decode()
 
         return self._format_summary_result(result_text, news_data)
     
@@ -764,14 +975,12 @@ Output in Korean with JSON format."""
         original_news: List[Dict[str, Any]]
     ) -> str:
         """OpenAI 응답을 보기 좋게 포맷팅합니다."""
-        from datetime import datetime
-
         lines = [
             "=" * 60,
             "# 📰 AI 뉴스 요약 리포트",
             "=" * 60,
             "",
-            f"**생성일시:** {datetime.now().strftime('%Y년 %m월 %d일 %H:%M')}",
+            f"**생성일시:** {time.strftime('%Y년 %m월 %d일 %H:%M')}",
             f"**분석 기사 수:** {len(original_news)}개",
             "",
             "---",
@@ -791,19 +1000,19 @@ Output in Korean with JSON format."""
         lines.append("")
         
         # 키워드별로 그룹화
-        keywords_seen = {}
+        keywords_seen: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         for item in original_news:
-            keyword = item.get("keyword", "기타")
-            if keyword not in keywords_seen:
-                keywords_seen[keyword] = []
-            keywords_seen[keyword].append(item)
-        
-        for keyword, items in keywords_seen.items():
-            lines.append(f"### 🏷️ {keyword}")
-            for item in items:
-                lines.append(f"- [{item['제목']}]({item['link']})")
-                lines.append(f"  📅 {item['pubDate']}")
-            lines.append("")
+            keywords_seen[item.get("keyword", "기타")].append(item)
+        
+        lines.extend(
+            f"### 🏷️ {keyword}\n"
+            + "".join(
+                f"- [{item['제목']}]({item['link']})\n"
+                f"  📅 {item['pubDate']}\n"
+                for item in items
+            )
+            for keyword, items in keywords_seen.items()
+        )
         
         lines.append("---")
         lines.append("*본 요약은 OpenAI를 활용하여 자동 생성되었습니다.*")
@@ -818,14 +1027,22 @@ Output in Korean with JSON format."""
         include_links: bool
     ) -> str:
         """레포트 문서를 생성합니다."""
-        from datetime import datetime
-        
-        lines = [
+        return "".join(self._iter_report(topic, search_queries, articles, include_links))
+    
+    def _iter_report(
+        self,
+        topic: str,
+        search_queries: List[str],
+        articles: List[Dict[str, Any]],
+        include_links: bool
+    ) -> Iterator[str]:
+        """레포트 문서를 헤더, 기사 블록, 푸터 순서의 조각으로 생성합니다."""
+        yield "\n".join([
             "=" * 60,
             f"# 📊 뉴스 리서치 레포트: {topic}",
             "=" * 60,
             "",
-            f"**생성일시:** {datetime.now().strftime('%Y년 %m월 %d일 %H:%M')}",
+            f"**생성일시:** {time.strftime('%Y년 %m월 %d일 %H:%M')}",
             f"**분석 기사 수:** {len(articles)}개",
             f"**검색 키워드:** {', '.join(search_queries)}",
             "",
@@ -838,65 +1055,42 @@ Output in Korean with JSON format."""
             "",
             "---",
             "",
-            "## 📰 주요 뉴스 요약",
             ""
-        ]
+        ])
+        yield _REPORT_ARTICLES_HEADER
         
-        # 기사별 요약
+        # 기사별 요약 (기사 하나당 한 블록, 링크 포함 여부에 따라 렌더러를 한 번만 선택)
+        render = _render_article_with_links if include_links else _render_article_no_links
         for i, article in enumerate(articles, 1):
-            lines.append(f"### {i}. {article['title']}")
-            lines.append(f"📅 **발행일:** {article['pubDate']}")
-            lines.append(f"")
-            lines.append(f"**내용 요약:**")
-            lines.append(f"> {article['description']}")
-            lines.append(f"")
-            
-            if include_links:
-                if article['originallink']:
-                    lines.append(f"🔗 [원문 보기]({article['originallink']})")
-                if article['link'] and article['link'] != article['originallink']:
-                    lines.append(f"🔗 [네이버 뉴스]({article['link']})")
-            
-            lines.append("")
-            lines.append("---")
-            lines.append("")
+            yield render(i, article)
         
         # 레포트 푸터
-        lines.extend([
-            "",
-            "---",
-            f"*본 레포트는 네이버 뉴스 검색 API를 통해 자동 생성되었습니다.*"
-        ])
-        
-        return "\n".join(lines)
+        yield _REPORT_FOOTER
     
     async def run(self):
         """Run the MCP server"""
-        # Setup initialization options
-        init_options = InitializationOptions(
-            server_name="news-mcp-server",
-            server_version="1.0.0",
-            capabilities={
-                "resources": {},
-                "tools": {},
-                "prompts": {},
-                "logging": {}
-            }
-        )
-        
         async with stdio_server() as (read_stream, write_stream):
             await self.app.run(
                 read_stream,
                 write_stream,
-                init_options
+                _INIT_OPTIONS
             )
 
 
 async def main():
     """Main entry point"""
     server = NewsMCPServer()
-    await server.run()
+    try:
+        await server.run()
+    finally:
+        await server.aclose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop이 설치되어 있으면 이벤트 루프로 사용 (선택 의존성)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop)